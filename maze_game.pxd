@@ -0,0 +1,70 @@
+# Cython declarations for maze_game.py.
+#
+# The module itself stays plain Python; when it is compiled with Cython
+# (see setup.py) this file augments it with C types for the maze grid and
+# the integer loop variables of the generator and solver.
+
+import cython
+
+
+cdef class Maze:
+    cdef public int width, height
+    cdef public bytearray grid
+    cdef public list rendered_rows
+    cdef object _rng
+
+    @cython.locals(
+        grid=cython.uchar[::1],
+        width=cython.int, max_x=cython.int, max_y=cython.int,
+        start_x=cython.int, start_y=cython.int,
+        x=cython.int, y=cython.int, dx=cython.int, dy=cython.int,
+        nx=cython.int, ny=cython.int, idx=cython.Py_ssize_t,
+    )
+    cpdef _generate(self)
+
+    @cython.locals(
+        grid=cython.uchar[::1],
+        width=cython.int, height=cython.int,
+        d=cython.int,
+        current=cython.Py_ssize_t, idx=cython.Py_ssize_t,
+        x=cython.int, y=cython.int, dx=cython.int, dy=cython.int,
+        nx=cython.int, ny=cython.int,
+    )
+    cpdef tuple _expand_layer(
+        self, list frontier, int[::1] parent, int[::1] depth, int[::1] other_depth
+    )
+
+    @cython.locals(
+        width=cython.int, size=cython.Py_ssize_t,
+        s=cython.Py_ssize_t, g=cython.Py_ssize_t, meet=cython.Py_ssize_t,
+        prev=cython.Py_ssize_t, current=cython.Py_ssize_t,
+    )
+    cpdef tuple solve(self, tuple start, tuple goal)
+
+    @cython.locals(width=cython.int, idx=cython.Py_ssize_t, x=cython.int, y=cython.int)
+    cpdef list reconstruct_path(self, parent, tuple goal)
+
+    @cython.locals(
+        grid=cython.uchar[::1],
+        width=cython.int, height=cython.int, gx=cython.int, gy=cython.int,
+        s=cython.Py_ssize_t, g=cython.Py_ssize_t, cost=cython.int,
+        current=cython.Py_ssize_t, idx=cython.Py_ssize_t,
+        x=cython.int, y=cython.int, dx=cython.int, dy=cython.int,
+        nx=cython.int, ny=cython.int,
+    )
+    cpdef list solve_astar(self, tuple start, tuple goal)
+
+    @cython.locals(
+        grid=cython.uchar[::1], towards=bytearray,
+        width=cython.int, height=cython.int,
+        root_idx=cython.Py_ssize_t, idx=cython.Py_ssize_t, nidx=cython.Py_ssize_t,
+        x=cython.int, y=cython.int, dx=cython.int, dy=cython.int,
+        nx=cython.int, ny=cython.int, back=cython.int,
+    )
+    cpdef bytearray path_tree(self, tuple root)
+
+    @cython.locals(
+        width=cython.int, x=cython.int, y=cython.int,
+        dx=cython.int, dy=cython.int, code=cython.int,
+    )
+    cpdef list walk_tree(self, bytearray tree, tuple start)
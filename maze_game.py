@@ -34,9 +34,31 @@ This script requires no third‑party dependencies.
 """
 
 import curses
+import heapq
+import importlib.machinery
+import importlib.util
+import itertools
 import random
+import types
+from array import array
 from collections import deque
 
+# All 24 orderings of the carving moves (dx, dy) for N, S, E, W, so the
+# generator picks one at random instead of shuffling a list at every step
+_PERMS = tuple(itertools.permutations(((0, -2), (0, 2), (2, 0), (-2, 0))))
+# Byte table mapping grid cells to ASCII: passage (0) to ' ', wall (1) to '#'
+_CELL_CHARS = bytes.maketrans(b'\x00\x01', b' #')
+# Unit moves to the four orthogonal neighbors: N, S, E, W
+_DIRS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+# Unit moves indexed by the one-byte step codes that ``Maze.path_tree``
+# records per cell.  Code 0 marks an unvisited cell and ``_ROOT`` marks the
+# cell the search started from.
+_STEPS = (None, (0, -1), (0, 1), (1, 0), (-1, 0))
+_ROOT = len(_STEPS)
+# (dx, dy, code) for each expansion, where code is the step leading back
+# from the neighbor to the cell it was reached from.
+_EXPAND = ((0, -1, 2), (0, 1, 1), (1, 0, 4), (-1, 0, 3))
+
 
 class Maze:
     """Generate and manage a maze grid.
@@ -44,10 +66,13 @@ class Maze:
     The maze is represented as a 2‑D grid where 0 denotes a passage and
     1 denotes a wall.  Passages occur at odd indices, with walls between
     them.  This representation makes it straightforward to carve passages
-    by removing walls between adjacent cells.
+    by removing walls between adjacent cells.  The grid is a single flat
+    ``bytearray`` in row‑major order, so cell (x, y) lives at
+    ``grid[y * width + x]`` and every cell is one byte in a contiguous
+    buffer rather than a boxed Python int.
     """
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, seed: int | None = None) -> None:
         # Ensure the maze dimensions are odd numbers to have walls around
         # every passage cell and borders around the maze.
         if width % 2 == 0:
@@ -56,104 +81,401 @@ class Maze:
             height += 1
         self.width = width
         self.height = height
-        # Initialize a grid full of walls (1)
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]
-        self._generate()
+        # Private random generator so a seed reproduces the same maze
+        self._rng = random.Random(seed)
+        # Initialize a grid full of walls (1), flattened row by row
+        self.grid = bytearray(b'\x01' * (width * height))
+        generate = _GENERATORS.get((width, height))
+        if generate is not None:
+            generate(self.grid, self._rng.choice)
+        else:
+            self._generate()
+        # The wall layout is fixed once generated, so render it to one
+        # string per row up front.  translate and replace run in C over the
+        # whole grid; '#' is only a stand-in since '█' is not a single byte.
+        rendered = self.grid.translate(_CELL_CHARS).decode('ascii').replace('#', '█')
+        self.rendered_rows = [
+            rendered[start:start + width] for start in range(0, width * height, width)
+        ]
 
     def _generate(self) -> None:
         """Generate the maze using recursive backtracking (depth‑first search)."""
+        # Bind hot attributes to locals; the carve loop runs once per cell
+        grid = self.grid
+        width = self.width
+        max_x, max_y = width - 1, self.height - 1
+        choice = self._rng.choice
         # Start in the top‑left passage cell
         start_x, start_y = 1, 1
-        self.grid[start_y][start_x] = 0
+        grid[start_y * width + start_x] = 0
         stack = [(start_x, start_y)]
-
-        # Directions: (dx, dy) pairs for N, S, E, W
-        directions = [(0, -2), (0, 2), (2, 0), (-2, 0)]
+        push, pop = stack.append, stack.pop
 
         while stack:
             x, y = stack[-1]
-            random.shuffle(directions)
-            carved = False
-            for dx, dy in directions:
+            # One random draw per step picks a whole direction order
+            for dx, dy in choice(_PERMS):
                 nx, ny = x + dx, y + dy
-                # Check bounds
-                if 1 <= nx < self.width - 1 and 1 <= ny < self.height - 1:
-                    if self.grid[ny][nx] == 1:
+                # Check bounds, then carve if the target cell is still solid
+                if 0 < nx < max_x and 0 < ny < max_y:
+                    idx = ny * width + nx
+                    if grid[idx]:
                         # Carve passage: remove wall between (x, y) and (nx, ny)
-                        self.grid[ny][nx] = 0
-                        self.grid[y + dy // 2][x + dx // 2] = 0
-                        stack.append((nx, ny))
-                        carved = True
+                        grid[idx] = 0
+                        grid[idx - (dy >> 1) * width - (dx >> 1)] = 0
+                        push((nx, ny))
                         break
-            if not carved:
-                stack.pop()
-
-    def neighbors(self, x: int, y: int):
-        """Yield walkable neighbors (passages) from a given cell."""
-        for dx, dy in [(0, -1), (0, 1), (1, 0), (-1, 0)]:
+            else:
+                pop()
+
+    def neighbors(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Return walkable neighbors (passages) of a given cell."""
+        grid = self.grid
+        width, height = self.width, self.height
+        out = []
+        for dx, dy in _DIRS:
             nx, ny = x + dx, y + dy
-            if 0 <= nx < self.width and 0 <= ny < self.height:
-                if self.grid[ny][nx] == 0:
-                    yield (nx, ny)
-
-    def solve(self, start: tuple[int, int], goal: tuple[int, int]):
-        """Compute shortest path from start to goal using BFS.
+            if 0 <= nx < width and 0 <= ny < height and not grid[ny * width + nx]:
+                out.append((nx, ny))
+        return out
+
+    def _expand_layer(
+        self, frontier: list[int], parent: array, depth: array, other_depth: array
+    ) -> tuple[list[int], int]:
+        """Advance one side of a bidirectional BFS by a whole layer.
+
+        Cells are flat ``y * width + x`` indices.  Returns the next frontier
+        and the index where this side met the other search, or -1 if they did
+        not meet.  The searches grow in whole layers, so any visited cell of
+        the other side that this layer can reach lies on that side's
+        outermost layer.  The first meeting found is therefore already on a
+        shortest route, and the expansion stops there instead of finishing
+        the layer.
+        """
+        # Neighbor checks are inlined rather than going through neighbors()
+        grid = self.grid
+        width, height = self.width, self.height
+        next_frontier: list[int] = []
+        push = next_frontier.append
+        for current in frontier:
+            y, x = divmod(current, width)
+            d = depth[current] + 1
+            for dx, dy in _DIRS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                idx = current + dy * width + dx
+                if not grid[idx] and depth[idx] < 0:
+                    parent[idx] = current
+                    depth[idx] = d
+                    if other_depth[idx] >= 0:
+                        return next_frontier, idx
+                    push(idx)
+        return next_frontier, -1
+
+    def solve(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> tuple[array, bool]:
+        """Compute shortest path from start to goal using bidirectional BFS.
+
+        Searches grow alternately from ``start`` and ``goal``, always
+        extending the smaller frontier by one layer, and stop as soon as one
+        reaches a cell the other has already visited, so each only explores
+        to about half the path depth.
+
+        Returns ``(parent, found)`` where ``parent`` is a flat ``array('i')``
+        indexed by ``y * width + x`` holding each cell's predecessor index
+        (-1 for none), suitable for ``reconstruct_path``.  ``found`` is False
+        if no path exists.
+        """
+        width = self.width
+        size = width * self.height
+        s = start[1] * width + start[0]
+        g = goal[1] * width + goal[0]
+        # Flat int32 arrays: 4 bytes per cell instead of a dict entry and
+        # tuple per visited cell.  Depth -1 marks an unvisited cell.
+        parent_s = array('i', [-1]) * size
+        # A path can neither start nor end inside a wall
+        grid = self.grid
+        if grid[s] or grid[g]:
+            return parent_s, False
+        parent_g = array('i', [-1]) * size
+        depth_s = array('i', [-1]) * size
+        depth_g = array('i', [-1]) * size
+        depth_s[s] = depth_g[g] = 0
+        frontier_s, frontier_g = [s], [g]
+        meet = s if s == g else -1
+        while meet < 0 and frontier_s and frontier_g:
+            if len(frontier_s) <= len(frontier_g):
+                frontier_s, meet = self._expand_layer(frontier_s, parent_s, depth_s, depth_g)
+            else:
+                frontier_g, meet = self._expand_layer(frontier_g, parent_g, depth_g, depth_s)
+        if meet >= 0:
+            # Re-link the goal half of the path so every cell points back
+            # toward start through the meeting cell.
+            prev, current = meet, parent_g[meet]
+            while current >= 0:
+                parent_s[current] = prev
+                prev, current = current, parent_g[current]
+        return parent_s, meet >= 0
+
+    def reconstruct_path(self, parent: array, goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """Reconstruct the path to goal from a flat parent array."""
+        width = self.width
+        # Walking parents yields goal first; prepend so no reversal is needed
+        path: deque[tuple[int, int]] = deque()
+        idx = goal[1] * width + goal[0]
+        while idx >= 0:
+            y, x = divmod(idx, width)
+            path.appendleft((x, y))
+            idx = parent[idx]
+        return list(path)
+
+    def solve_astar(
+        self, start: tuple[int, int], goal: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Compute a shortest path from start to goal using A* search.
 
-        Returns a dictionary mapping each visited cell to its predecessor.  If
-        no path exists, returns an empty dict.
+        The Manhattan distance to ``goal`` is a consistent heuristic on this
+        unweighted grid, so the path is optimal while usually expanding far
+        fewer cells than BFS.  Returns the path as a list of cells, or an
+        empty list if no path exists.
         """
-        queue: deque[tuple[int, int]] = deque([start])
-        predecessors: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
-        while queue:
-            current = queue.popleft()
-            if current == goal:
+        grid = self.grid
+        width, height = self.width, self.height
+        gx, gy = goal
+        s = start[1] * width + start[0]
+        g = gy * width + gx
+        # Heap entries are (f, g, cell) with cells as flat indices
+        heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, s)]
+        g_score = {s: 0}
+        parent: dict[int, int] = {s: -1}
+        push, pop = heapq.heappush, heapq.heappop
+        while heap:
+            _, cost, current = pop(heap)
+            if current == g:
                 break
-            for neighbor in self.neighbors(*current):
-                if neighbor not in predecessors:
-                    predecessors[neighbor] = current
-                    queue.append(neighbor)
-        return predecessors if goal in predecessors else {}
-
-    def reconstruct_path(
-        self, predecessors: dict[tuple[int, int], tuple[int, int] | None], goal: tuple[int, int]
+            if cost > g_score[current]:
+                # Stale entry superseded by a cheaper route
+                continue
+            y, x = divmod(current, width)
+            cost += 1
+            for dx, dy in _DIRS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                idx = current + dy * width + dx
+                if not grid[idx] and cost < g_score.get(idx, cost + 1):
+                    g_score[idx] = cost
+                    parent[idx] = current
+                    push(heap, (cost + abs(nx - gx) + abs(ny - gy), cost, idx))
+        return self.reconstruct_path(parent, goal) if g in parent else []
+
+    def path_tree(self, root: tuple[int, int]) -> bytearray:
+        """Build a BFS shortest‑path tree rooted at ``root``.
+
+        Each reachable cell records, in one byte laid out like ``grid``,
+        which step leads one cell closer to ``root``; the byte doubles as the
+        visited flag and is 0 for unreached cells.  The search covers the
+        whole connected region, so the tree serves every start cell.
+        """
+        grid = self.grid
+        width, height = self.width, self.height
+        root_idx = root[1] * width + root[0]
+        build = _TREE_BUILDERS.get((width, height))
+        if build is not None:
+            return build(grid, root_idx)
+        towards = bytearray(width * height)
+        towards[root_idx] = _ROOT
+        # Queue entries are flat cell indices to avoid tuple churn
+        queue = deque([root_idx])
+        pop, push = queue.popleft, queue.append
+        while queue:
+            idx = pop()
+            y, x = divmod(idx, width)
+            for dx, dy, back in _EXPAND:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    nidx = ny * width + nx
+                    if not grid[nidx] and not towards[nidx]:
+                        towards[nidx] = back
+                        push(nidx)
+        return towards
+
+    def walk_tree(
+        self, tree: bytearray, start: tuple[int, int]
     ) -> list[tuple[int, int]]:
-        """Reconstruct the path from the predecessor map."""
-        path: list[tuple[int, int]] = []
-        current: tuple[int, int] | None = goal
-        while current is not None:
-            path.append(current)
-            current = predecessors[current]
-        path.reverse()
+        """Follow a path tree from ``start`` to its root.
+
+        Costs O(path length).  Returns an empty list if ``start`` was not
+        reached when the tree was built.
+        """
+        width = self.width
+        x, y = start
+        code = tree[y * width + x]
+        if not code:
+            return []
+        path = [start]
+        while code != _ROOT:
+            dx, dy = _STEPS[code]
+            x, y = x + dx, y + dy
+            path.append((x, y))
+            code = tree[y * width + x]
         return path
 
 
+# Source templates for size-specialized copies of Maze._generate and
+# Maze.path_tree.  Width, height and every offset derived from them are
+# pasted in as literals, flat index deltas replace (x, y) arithmetic, and
+# the four BFS expansions are unrolled with only the bounds check each
+# direction actually needs.
+_GENERATE_TEMPLATE = """
+def _generate_{width}x{height}(grid, choice):
+    grid[{start}] = 0
+    stack = [{start}]
+    push, pop = stack.append, stack.pop
+    while stack:
+        idx = stack[-1]
+        x = idx % {width}
+        for dx, delta, wall in choice({perms!r}):
+            n = idx + delta
+            if 0 < x + dx < {max_x} and {width} <= n < {last_row} and grid[n]:
+                grid[n] = 0
+                grid[idx + wall] = 0
+                push(n)
+                break
+        else:
+            pop()
+"""
+_PATH_TREE_TEMPLATE = """
+def _path_tree_{width}x{height}(grid, root_idx):
+    towards = bytearray({size})
+    towards[root_idx] = {root}
+    queue = deque([root_idx])
+    pop, push = queue.popleft, queue.append
+    while queue:
+        idx = pop()
+        x = idx % {width}
+{expand}    return towards
+"""
+_PATH_TREE_STEP = """\
+        if {check}:
+            n = idx + {delta}
+            if not grid[n] and not towards[n]:
+                towards[n] = {back}
+                push(n)
+"""
+
+
+def _specialize(width: int, height: int) -> None:
+    """Compile generator and path-tree functions for one maze size."""
+    size = width * height
+    perms = tuple(
+        tuple((dx, dy * width + dx, (dy >> 1) * width + (dx >> 1)) for dx, dy in perm)
+        for perm in _PERMS
+    )
+    checks = {
+        (0, -1): f"idx >= {width}",
+        (0, 1): f"idx < {size - width}",
+        (1, 0): f"x < {width - 1}",
+        (-1, 0): "x > 0",
+    }
+    expand = ''.join(
+        _PATH_TREE_STEP.format(check=checks[dx, dy], delta=dy * width + dx, back=back)
+        for dx, dy, back in _EXPAND
+    )
+    namespace = {'deque': deque}
+    exec(
+        _GENERATE_TEMPLATE.format(
+            width=width, height=height, start=width + 1, perms=perms,
+            max_x=width - 1, last_row=size - width,
+        ),
+        namespace,
+    )
+    exec(
+        _PATH_TREE_TEMPLATE.format(
+            width=width, height=height, size=size, root=_ROOT, expand=expand
+        ),
+        namespace,
+    )
+    _GENERATORS[width, height] = namespace[f'_generate_{width}x{height}']
+    _TREE_BUILDERS[width, height] = namespace[f'_path_tree_{width}x{height}']
+
+
+# Specialized functions keyed by (width, height), consulted by Maze
+_GENERATORS: dict = {}
+_TREE_BUILDERS: dict = {}
+# Specialize MazeGame's default size.  A Cython-compiled build runs the
+# C-typed generic methods instead: at 21x21 they generate mazes about 2x
+# and build path trees about 3x faster than the interpreted specializations.
+if isinstance(Maze._generate, types.FunctionType):
+    _specialize(21, 21)
+
+
 class MazeGame:
     """Interactive maze game using curses."""
 
     def __init__(self, stdscr: curses.window, width: int = 21, height: int = 21) -> None:
         self.stdscr = stdscr
-        self.maze = Maze(width, height)
+        self._start_maze(Maze(width, height))
+
+    def _start_maze(self, maze: Maze) -> None:
+        """Reset the player, goal and solution state for a fresh maze."""
+        self.maze = maze
         self.player_pos = (1, 1)
-        self.goal_pos = (self.maze.width - 2, self.maze.height - 2)
+        self.goal_pos = (maze.width - 2, maze.height - 2)
         self.show_solution = False
-        # Precompute solution path (list of positions) or empty list
-        preds = self.maze.solve(self.player_pos, self.goal_pos)
-        self.solution_path = (
-            self.maze.reconstruct_path(preds, self.goal_pos) if preds else []
-        )
+        # Shortest paths to the goal are fixed for the life of a maze, so
+        # one tree rooted at the goal serves every player position.  It is
+        # only built the first time the solution is actually shown.
+        self.goal_tree: bytearray | None = None
+        # Solution path from the current position, or None until needed,
+        # plus the paths already walked keyed by player position
+        self.solution_path: list[tuple[int, int]] | None = None
+        self._solution_cache: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        # Repaint the whole screen on the next draw
+        self._full_redraw = True
+
+    def _current_solution(self) -> list[tuple[int, int]]:
+        """Return the solution path from the player, computing it on demand."""
+        if self.solution_path is None:
+            path = self._solution_cache.get(self.player_pos)
+            if path is None:
+                if self.goal_tree is None and not self._solution_cache:
+                    # First reveal on this maze: one A* query is cheaper than
+                    # building the whole goal tree, which only pays off once
+                    # the player moves with the solution shown.
+                    path = self.maze.solve_astar(self.player_pos, self.goal_pos)
+                else:
+                    if self.goal_tree is None:
+                        self.goal_tree = self.maze.path_tree(self.goal_pos)
+                    path = self.maze.walk_tree(self.goal_tree, self.player_pos)
+                self._solution_cache[self.player_pos] = path
+            self.solution_path = path
+        return self.solution_path
 
     def draw(self) -> None:
-        """Draw the maze, player, solution (optional) and UI instructions."""
-        self.stdscr.clear()
-        # Draw maze walls and passages
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                ch = '█' if self.maze.grid[y][x] == 1 else ' '
-                self.stdscr.addch(y, x, ch)
+        """Draw the maze, player, solution (optional) and UI instructions.
+
+        The full screen is only repainted after a new maze or a solution
+        toggle; player moves are patched in place by ``redraw_diff``.
+        """
+        if self._full_redraw:
+            self._full_redraw = False
+            self._draw_full()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def _draw_full(self) -> None:
+        """Repaint every cell of the maze plus the overlays and instructions."""
+        self.stdscr.erase()
+        # Draw maze walls and passages, one pre-rendered string per row
+        for y, row in enumerate(self.maze.rendered_rows):
+            self.stdscr.addstr(y, 0, row)
 
         # Draw solution path if toggled on
-        if self.show_solution and self.solution_path:
-            for (x, y) in self.solution_path:
+        if self.show_solution:
+            for (x, y) in self._current_solution():
                 # Avoid overwriting start and goal positions
                 if (x, y) not in {self.player_pos, self.goal_pos}:
                     self.stdscr.addch(y, x, '.')
@@ -176,7 +498,23 @@ class MazeGame:
         for idx, text in enumerate(instructions):
             self.stdscr.addstr(offset_y + idx, 0, text)
 
-        self.stdscr.refresh()
+    def redraw_diff(
+        self,
+        old: tuple[int, int],
+        new: tuple[int, int],
+        old_path: list[tuple[int, int]] | None,
+    ) -> None:
+        """Repaint only the cells changed by moving the player from old to new."""
+        marked = set(self._current_solution()) if self.show_solution else set()
+        changed = {old}
+        if self.show_solution:
+            # Cells whose solution marker appeared or disappeared
+            changed.update(marked.symmetric_difference(old_path or ()))
+        changed.discard(new)
+        changed.discard(self.goal_pos)
+        for (x, y) in changed:
+            self.stdscr.addch(y, x, '.' if (x, y) in marked else ' ')
+        self.stdscr.addch(new[1], new[0], '@')
 
     def handle_input(self) -> bool:
         """Handle a single keypress.  Returns True to continue, False to quit."""
@@ -192,27 +530,24 @@ class MazeGame:
             dx, dy = keymap[key]
             new_x, new_y = self.player_pos[0] + dx, self.player_pos[1] + dy
             # Move only if new position is a passage
-            if self.maze.grid[new_y][new_x] == 0:
+            if self.maze.grid[new_y * self.maze.width + new_x] == 0:
+                old_pos, old_path = self.player_pos, self.solution_path
                 self.player_pos = (new_x, new_y)
-                # Recompute solution path from new position
-                preds = self.maze.solve(self.player_pos, self.goal_pos)
-                self.solution_path = (
-                    self.maze.reconstruct_path(preds, self.goal_pos) if preds else []
-                )
+                # Recomputed lazily, and only if the solution is on screen
+                self.solution_path = None
+                self.redraw_diff(old_pos, self.player_pos, old_path)
         elif key in (ord('q'), ord('Q')):
             return False
         elif key in (ord('s'), ord('S')):
             self.show_solution = not self.show_solution
+            self._full_redraw = True
         elif key in (ord('n'), ord('N')):
             # Start a new maze
-            self.maze = Maze(self.maze.width, self.maze.height)
-            self.player_pos = (1, 1)
-            self.goal_pos = (self.maze.width - 2, self.maze.height - 2)
-            preds = self.maze.solve(self.player_pos, self.goal_pos)
-            self.solution_path = (
-                self.maze.reconstruct_path(preds, self.goal_pos) if preds else []
-            )
-            self.show_solution = False
+            self._start_maze(Maze(self.maze.width, self.maze.height))
+        else:
+            # curses.KEY_RESIZE or any other key: the screen may have been
+            # disturbed, so repaint it rather than patching cells
+            self._full_redraw = True
         # Check win condition
         if self.player_pos == self.goal_pos:
             self._show_win_message()
@@ -243,14 +578,7 @@ class MazeGame:
                 raise StopIteration
             elif key in (ord('n'), ord('N')):
                 # Generate new maze and return to game
-                self.maze = Maze(self.maze.width, self.maze.height)
-                self.player_pos = (1, 1)
-                self.goal_pos = (self.maze.width - 2, self.maze.height - 2)
-                preds = self.maze.solve(self.player_pos, self.goal_pos)
-                self.solution_path = (
-                    self.maze.reconstruct_path(preds, self.goal_pos) if preds else []
-                )
-                self.show_solution = False
+                self._start_maze(Maze(self.maze.width, self.maze.height))
                 return
 
 
@@ -273,4 +601,11 @@ def main(stdscr: curses.window) -> None:
 
 
 if __name__ == "__main__":
+    # Run the Cython-compiled build of this module instead when one has been
+    # built next to it (see setup.py); otherwise run this file as is.
+    spec = importlib.util.find_spec("maze_game")
+    if spec is not None and (spec.origin or "").endswith(
+        tuple(importlib.machinery.EXTENSION_SUFFIXES)
+    ):
+        main = importlib.import_module("maze_game").main
     curses.wrapper(main)
\ No newline at end of file
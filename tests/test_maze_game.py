@@ -0,0 +1,263 @@
+"""Tests for the maze generator, solvers and game screen."""
+
+import curses
+import random
+import unittest
+from array import array
+from collections import deque
+from unittest import mock
+
+import maze_game
+
+
+def bfs_length(maze, start, goal):
+    """Number of cells on a shortest path found by plain BFS, or None."""
+    width, height = maze.width, maze.height
+    dist = {start: 1}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return dist[goal]
+        for dx, dy in ((0, -1), (0, 1), (1, 0), (-1, 0)):
+            nx, ny = x + dx, y + dy
+            if (
+                0 <= nx < width
+                and 0 <= ny < height
+                and not maze.grid[ny * width + nx]
+                and (nx, ny) not in dist
+            ):
+                dist[nx, ny] = dist[x, y] + 1
+                queue.append((nx, ny))
+    return None
+
+
+def open_loops(maze):
+    """Knock out interior walls on a fixed stride so the maze has cycles."""
+    width = maze.width
+    for idx in range(width + 1, len(maze.grid) - width - 1, 7):
+        if 0 < idx % width < width - 1:
+            maze.grid[idx] = 0
+    # Keep the pre-rendered wall rows in step with the edited grid
+    rendered = maze.grid.translate(maze_game._CELL_CHARS).decode('ascii')
+    maze.rendered_rows = [
+        rendered[start:start + width].replace('#', '█')
+        for start in range(0, len(rendered), width)
+    ]
+
+
+class FakeWindow:
+    """Minimal stand-in for a curses window that records what is drawn."""
+
+    def __init__(self, keys=()):
+        self.keys = list(keys)
+        self.cells = {}
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else ord('q')
+
+    def addch(self, y, x, ch):
+        self.cells[y, x] = ch
+
+    def addstr(self, y, x, text):
+        for offset, ch in enumerate(text):
+            self.cells[y, x + offset] = ch
+
+    def erase(self):
+        self.cells = {}
+
+    clear = erase
+
+    def noutrefresh(self):
+        pass
+
+    refresh = noutrefresh
+
+    def getmaxyx(self):
+        return (40, 100)
+
+
+class GenerateTest(unittest.TestCase):
+    def test_generates_perfect_maze(self):
+        for width, height in [(21, 21), (31, 15), (5, 5), (3, 3)]:
+            maze = maze_game.Maze(width, height, seed=width * height)
+            grid, width, height = maze.grid, maze.width, maze.height
+            for x in range(width):
+                self.assertEqual(grid[x], 1)
+                self.assertEqual(grid[(height - 1) * width + x], 1)
+            for y in range(height):
+                self.assertEqual(grid[y * width], 1)
+                self.assertEqual(grid[y * width + width - 1], 1)
+            rooms = [(x, y) for y in range(1, height, 2) for x in range(1, width, 2)]
+            for x, y in rooms:
+                self.assertEqual(grid[y * width + x], 0)
+                self.assertIsNotNone(bfs_length(maze, (1, 1), (x, y)))
+            # A spanning tree over the rooms opens exactly one wall per edge
+            self.assertEqual(grid.count(0), 2 * len(rooms) - 1)
+
+    def test_even_sizes_round_up(self):
+        maze = maze_game.Maze(20, 10, seed=0)
+        self.assertEqual((maze.width, maze.height), (21, 11))
+        self.assertEqual(len(maze.grid), 21 * 11)
+
+    def test_seed_reproduces_maze(self):
+        for size in [(21, 21), (41, 25)]:
+            first = maze_game.Maze(*size, seed=7)
+            second = maze_game.Maze(*size, seed=7)
+            self.assertEqual(first.grid, second.grid)
+
+    def test_rendered_rows_match_grid(self):
+        maze = maze_game.Maze(27, 13, seed=4)
+        expected = [
+            ''.join(
+                '█' if maze.grid[y * maze.width + x] else ' '
+                for x in range(maze.width)
+            )
+            for y in range(maze.height)
+        ]
+        self.assertEqual(maze.rendered_rows, expected)
+
+
+class SolveTest(unittest.TestCase):
+    def assert_shortest(self, maze, path, start, goal):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(len(path), bfs_length(maze, start, goal))
+        for (x, y), (nx, ny) in zip(path, path[1:]):
+            self.assertEqual(abs(nx - x) + abs(ny - y), 1)
+            self.assertEqual(maze.grid[ny * maze.width + nx], 0)
+
+    def test_solvers_agree_with_bfs_on_mazes_with_loops(self):
+        for seed in range(20):
+            maze = maze_game.Maze(25, 17, seed=seed)
+            open_loops(maze)
+            cells = [
+                (x, y)
+                for y in range(maze.height)
+                for x in range(maze.width)
+                if not maze.grid[y * maze.width + x]
+                and bfs_length(maze, (1, 1), (x, y)) is not None
+            ]
+            for start, goal in zip(cells[::5], cells[::-7]):
+                parent, found = maze.solve(start, goal)
+                self.assertTrue(found)
+                self.assert_shortest(maze, maze.reconstruct_path(parent, goal), start, goal)
+                self.assert_shortest(maze, maze.solve_astar(start, goal), start, goal)
+                tree = maze.path_tree(goal)
+                self.assert_shortest(maze, maze.walk_tree(tree, start), start, goal)
+
+    def test_solve_returns_flat_parent_array(self):
+        maze = maze_game.Maze(21, 15, seed=2)
+        start, goal = (1, 1), (19, 13)
+        parent, found = maze.solve(start, goal)
+        self.assertIsInstance(parent, array)
+        self.assertEqual(parent.typecode, 'i')
+        self.assertEqual(len(parent), maze.width * maze.height)
+        self.assertIs(found, True)
+        # Parents are flat indices, and the start cell has none
+        self.assertEqual(parent[start[1] * maze.width + start[0]], -1)
+        path = maze.reconstruct_path(parent, goal)
+        for (px, py), cell in zip(path, path[1:]):
+            x, y = cell
+            self.assertEqual(parent[y * maze.width + x], py * maze.width + px)
+
+    def test_unreachable_goal(self):
+        maze = maze_game.Maze(21, 21, seed=5)
+        open_loops(maze)
+        gx, gy = goal = (19, 19)
+        # Wall the goal in on every side
+        for dx, dy in ((0, -1), (0, 1), (1, 0), (-1, 0)):
+            maze.grid[(gy + dy) * maze.width + gx + dx] = 1
+        self.assertIsNone(bfs_length(maze, (1, 1), goal))
+        self.assertFalse(maze.solve((1, 1), goal)[1])
+        self.assertEqual(maze.solve_astar((1, 1), goal), [])
+        self.assertEqual(maze.walk_tree(maze.path_tree(goal), (1, 1)), [])
+
+    def test_wall_endpoints_have_no_path(self):
+        maze = maze_game.Maze(21, 21, seed=3)
+        self.assertEqual(maze.grid[1 * 21 + 2], 1)
+        self.assertFalse(maze.solve((1, 1), (2, 1))[1])
+        self.assertFalse(maze.solve((2, 1), (1, 1))[1])
+
+
+class AStarTest(unittest.TestCase):
+    def test_matches_bfs_length(self):
+        for seed in range(10):
+            maze = maze_game.Maze(31, 21, seed=seed)
+            goal = (maze.width - 2, maze.height - 2)
+            path = maze.solve_astar((1, 1), goal)
+            self.assertEqual(path[0], (1, 1))
+            self.assertEqual(path[-1], goal)
+            self.assertEqual(len(path), bfs_length(maze, (1, 1), goal))
+
+    def test_wall_goal_has_no_path(self):
+        maze = maze_game.Maze(21, 21, seed=3)
+        self.assertEqual(maze.solve_astar((1, 1), (2, 1)), [])
+
+
+class MazeGameSolutionTest(unittest.TestCase):
+    def test_first_reveal_uses_astar_then_goal_tree(self):
+        game = maze_game.MazeGame(FakeWindow())
+        game.show_solution = True
+        with mock.patch.object(curses, 'doupdate'):
+            game.draw()
+        self.assertIsNone(game.goal_tree)
+        first = game.solution_path
+        self.assertEqual(len(first), bfs_length(game.maze, (1, 1), game.goal_pos))
+        # Moving along the path switches to the shared goal tree
+        game.player_pos = first[1]
+        game.solution_path = None
+        self.assertEqual(game._current_solution(), first[1:])
+        self.assertIsNotNone(game.goal_tree)
+
+
+class RedrawTest(unittest.TestCase):
+    def test_incremental_redraw_matches_full_repaint(self):
+        moves = [curses.KEY_UP, curses.KEY_DOWN, curses.KEY_LEFT, curses.KEY_RIGHT]
+        for seed in range(20):
+            rng = random.Random(seed)
+            keys = [rng.choice(moves + [ord('s')]) for _ in range(150)]
+            window = FakeWindow(keys)
+            game = maze_game.MazeGame(window)
+            if seed % 2:
+                # With loops, a single step can reroute the whole solution
+                open_loops(game.maze)
+            with mock.patch.object(curses, 'doupdate'):
+                for _ in keys:
+                    game.draw()
+                    fresh = FakeWindow()
+                    game.stdscr = fresh
+                    game._draw_full()
+                    game.stdscr = window
+                    self.assertEqual(window.cells, fresh.cells, f"seed {seed}")
+                    try:
+                        game.handle_input()
+                    except StopIteration:
+                        break
+
+
+@unittest.skipUnless(
+    (21, 21) in maze_game._GENERATORS, "specialization is off in compiled builds"
+)
+class SpecializedMazeTest(unittest.TestCase):
+    def test_generator_matches_generic(self):
+        for seed in range(50):
+            specialized = maze_game.Maze(21, 21, seed=seed)
+            with mock.patch.dict(maze_game._GENERATORS, clear=True):
+                generic = maze_game.Maze(21, 21, seed=seed)
+            self.assertEqual(specialized.grid, generic.grid, f"seed {seed}")
+
+    def test_path_tree_matches_generic(self):
+        for seed in range(20):
+            maze = maze_game.Maze(21, 21, seed=seed)
+            # Open extra walls so the tree has to pick between routes
+            open_loops(maze)
+            for root in [(1, 1), (19, 19), (9, 11), (2, 1)]:
+                specialized = maze.path_tree(root)
+                with mock.patch.dict(maze_game._TREE_BUILDERS, clear=True):
+                    generic = maze.path_tree(root)
+                self.assertEqual(specialized, generic, f"seed {seed}, root {root}")
+
+
+if __name__ == "__main__":
+    unittest.main()